@@ -7,9 +7,125 @@ Handles comprehensive data cleaning and preprocessing with enhanced structure
 import pandas as pd
 import numpy as np
 import os
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 import warnings
-warnings.filterwarnings('ignore')
+
+# Optional pyarrow import for Arrow-backed strings and CSV writing
+try:
+    import pyarrow
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Optional numba import for the JIT code remapping kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Minimum table size before the numba kernel pays off its dispatch cost
+LARGE_TABLE_MIN_ROWS = 100_000
+
+# Whitespace-run pattern for Arrow string columns; kept as a string because
+# pandas only hands uncompiled patterns to Arrow's regex kernel
+WHITESPACE_RUN_PATTERN = r'\s+'
+
+# ISO-3 country code mapping for standardization, keyed by lowercase name
+COUNTRY_MAPPING = MappingProxyType({
+    'usa': 'USA',
+    'us': 'USA', 
+    'america': 'USA',
+    'united states of america': 'USA',
+    'united states': 'USA',
+    'uk': 'GBR',
+    'britain': 'GBR',
+    'great britain': 'GBR',
+    'england': 'GBR',
+    'united kingdom': 'GBR',
+    'deutschland': 'DEU',
+    'germany': 'DEU',
+    'brasil': 'BRA',
+    'brazil': 'BRA',
+    'espana': 'ESP',
+    'españa': 'ESP',
+    'spain': 'ESP',
+    'china': 'CHN',
+    'prc': 'CHN',
+    'canada': 'CAN',
+    'france': 'FRA',
+    'italia': 'ITA',
+    'italy': 'ITA',
+    'india': 'IND',
+    'japan': 'JPN',
+    'australia': 'AUS',
+    'mexico': 'MEX',
+    'netherlands': 'NLD',
+    'holland': 'NLD'
+})
+
+# Lowercase lookup; ISO codes map to themselves so they skip re-casing
+COUNTRY_LOOKUP = MappingProxyType({
+    **{isoCode.lower(): isoCode for isoCode in COUNTRY_MAPPING.values()},
+    **COUNTRY_MAPPING
+})
+
+# Valid status values for filtering, and their sorted category index
+VALID_STATUSES = frozenset({'No Show', 'Registered', 'Attended', 'Responded'})
+STATUS_CATEGORIES = pd.Index(sorted(VALID_STATUSES))
+
+# Comprehensive status mapping for variations
+STATUS_MAPPING = MappingProxyType({
+    'No-Show': 'No Show',
+    'Noshow': 'No Show',
+    'No_Show': 'No Show',
+    'Did Not Show': 'No Show',
+    'Absent': 'No Show',
+    'Reg': 'Registered',
+    'Registration': 'Registered',
+    'Sign Up': 'Registered',
+    'Signup': 'Registered',
+    'Attend': 'Attended',
+    'Present': 'Attended',
+    'Showed Up': 'Attended',
+    'Response': 'Responded',
+    'Reply': 'Responded',
+    'Answered': 'Responded',
+    'Feedback': 'Responded'
+})
+
+# Single lowercase lookup from any casing of a valid status or variant
+STATUS_LOOKUP = MappingProxyType({
+    **{status.lower(): status for status in VALID_STATUSES},
+    **{variant.lower(): status for variant, status in STATUS_MAPPING.items()}
+})
+
+
+def _collapseWhitespace(text: str) -> str:
+    """
+    Strip a string and collapse each internal whitespace run to one space
+    
+    str.split() with no separator splits on any Unicode whitespace run and drops
+    leading/trailing whitespace, matching strip() plus a \\s+ regex replace.
+    """
+    return ' '.join(text.split())
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _remapCodesKernel(sourceCodes, codeRemap):
+        """
+        Translate factorized codes through a per-value lookup table
+        
+        Negative source codes mark null values and stay -1.
+        """
+        remappedCodes = np.empty(sourceCodes.shape[0], np.int8)
+        for row in range(sourceCodes.shape[0]):
+            sourceCode = sourceCodes[row]
+            remappedCodes[row] = codeRemap[sourceCode] if sourceCode >= 0 else -1
+        return remappedCodes
 
 
 class DataCleaner:
@@ -26,7 +142,12 @@ class DataCleaner:
         
         @param {pd.DataFrame} dataFrame - Raw dataframe to be cleaned and processed
         """
-        self.rawData = dataFrame.copy()
+        # Reference only; cleanData takes the single working copy when mutation begins
+        self.rawData = dataFrame
+        
+        # Raw-data quality stats, captured once (missing count during the empty-row scan)
+        self._rawShape = dataFrame.shape
+        self._rawMissing = None
         self.cleanedData = None
         self.cleaningLog = []
         
@@ -35,6 +156,30 @@ class DataCleaner:
         self.channelColumn = 'Prospect Source'
         self.geoColumn = 'Country'
         self.jobColumn = 'Job Title'
+        self.timestampColumns = ('Opt-In Timestamp', 'Opt-Out Timestamp')
+        self.timestampFormat = '%Y-%m-%d %H:%M:%S'
+        
+        # Shared read-only mapping tables (module constants, never rebuilt per instance)
+        self.countryLookup = COUNTRY_LOOKUP
+        self.validStatuses = VALID_STATUSES
+        self.statusCategories = STATUS_CATEGORIES
+        self.statusLookup = STATUS_LOOKUP
+        
+        # Specialize the pipeline to the input schema once: text columns to
+        # normalize, timestamp columns (with their flag names) and categorical
+        # columns to prune are resolved here instead of on every pass
+        presentColumns = set(dataFrame.columns)
+        self._textColumns = [
+            column for column, columnType in dataFrame.dtypes.items()
+            if columnType == object or isinstance(columnType, pd.StringDtype)
+        ]
+        self._timestampFlags = [
+            (column, column.replace(' Timestamp', '').replace('-', '_').lower() + '_flag')
+            for column in self.timestampColumns if column in presentColumns
+        ]
+        self._categoricalColumns = [
+            column for column in (self.statusColumn, self.geoColumn) if column in presentColumns
+        ]
     
     def cleanData(self) -> pd.DataFrame:
         """
@@ -53,8 +198,15 @@ class DataCleaner:
         print("🧹 Starting comprehensive data cleaning process...")
         dataFrame = self.rawData.copy()
         
-        # Step 1: Remove completely empty rows for data integrity
-        dataFrame = self._removeEmptyRows(dataFrame)
+        # Move Python-object text columns onto Arrow-backed string storage
+        if PYARROW_AVAILABLE:
+            dataFrame = self._convertToArrowStrings(dataFrame)
+        
+        # Steps 1-5 only replace columns and narrow a row keep-mask; rows are
+        # filtered and reordered by a single gather once all masks are known
+        
+        # Step 1: Flag completely empty rows for data integrity
+        keepMask = self._findNonEmptyRows(dataFrame)
         
         # Step 2: Clean and standardize string columns
         dataFrame = self._cleanStringColumns(dataFrame)
@@ -63,10 +215,20 @@ class DataCleaner:
         dataFrame = self._standardizeGeography(dataFrame)
         
         # Step 4: Clean and validate prospect status values
-        dataFrame = self._cleanProspectStatus(dataFrame)
+        keepMask = self._cleanProspectStatus(dataFrame, keepMask)
+        
+        # Parse timestamps once; deduplication and flag creation reuse them
+        for column, _ in self._timestampFlags:
+            dataFrame[column] = self._parseTimestamps(dataFrame[column])
         
-        # Step 5: Remove duplicate records based on unique identifiers
-        dataFrame = self._deduplicateRecords(dataFrame)
+        # Step 5: Order and deduplicate records based on unique identifiers
+        rowPositions = self._deduplicateRecords(dataFrame, keepMask)
+        dataFrame = dataFrame.iloc[rowPositions]
+        for column in self._categoricalColumns:
+            dataFrame[column] = dataFrame[column].cat.remove_unused_categories()
+        
+        # Narrow integer and integer-looking columns on the final (smaller) frame
+        dataFrame = self._downcastNumericColumns(dataFrame)
         
         # Step 6: Process and normalize timestamp data
         dataFrame = self._processTimestamps(dataFrame)
@@ -76,26 +238,46 @@ class DataCleaner:
         
         return dataFrame
     
-    def _removeEmptyRows(self, dataFrame: pd.DataFrame) -> pd.DataFrame:
+    def _convertToArrowStrings(self, dataFrame: pd.DataFrame) -> pd.DataFrame:
         """
-        Remove completely empty rows from the dataset
+        Convert object-dtype text columns to Arrow-backed string columns
+        
+        Arrow strings live in contiguous UTF-8 buffers, so the .str cleaning
+        operations below run as compiled kernels instead of per-object Python
+        calls. Columns already using a string dtype are left untouched.
         
-        Identifies and removes rows that contain only null values across all columns.
+        @param {pd.DataFrame} dataFrame - Input dataframe to process
+        @returns {pd.DataFrame} DataFrame with Arrow-backed text columns
+        """
+        for column, columnType in dataFrame.dtypes.items():
+            if columnType == object:
+                dataFrame[column] = dataFrame[column].astype('string[pyarrow]')
+        
+        return dataFrame
+    
+    def _findNonEmptyRows(self, dataFrame: pd.DataFrame) -> np.ndarray:
+        """
+        Flag completely empty rows for removal from the dataset
+        
+        Identifies rows that contain only null values across all columns.
         Logs the number of rows removed for transparency.
         
         @param {pd.DataFrame} dataFrame - Input dataframe to process
-        @returns {pd.DataFrame} DataFrame without completely empty rows
+        @returns {np.ndarray} Boolean keep-mask that is False for completely empty rows
         """
-        initialRows = len(dataFrame)
-        dataFrame = dataFrame.dropna(how='all')
+        presentMask = dataFrame.notna()
+        keepMask = presentMask.any(axis=1).to_numpy()
+        
+        # The same presence scan yields the raw missing-value count for the quality summary
+        self._rawMissing = int(presentMask.size - presentMask.to_numpy().sum())
         
-        if len(dataFrame) < initialRows:
-            removedCount = initialRows - len(dataFrame)
+        removedCount = len(keepMask) - int(keepMask.sum())
+        if removedCount > 0:
             logEntry = f"Removed {removedCount} completely empty rows"
             self.cleaningLog.append(logEntry)
             print(f"  • {logEntry}")
         
-        return dataFrame
+        return keepMask
     
     def _cleanStringColumns(self, dataFrame: pd.DataFrame) -> pd.DataFrame:
         """
@@ -110,17 +292,23 @@ class DataCleaner:
         @param {pd.DataFrame} dataFrame - Input dataframe to process
         @returns {pd.DataFrame} DataFrame with cleaned string columns
         """
-        stringColumns = dataFrame.select_dtypes(include=['object']).columns
-        
-        for column in stringColumns:
-            # Remove leading and trailing spaces for consistency
-            dataFrame[column] = dataFrame[column].astype(str).str.strip()
+        for column in self._textColumns:
+            columnValues = dataFrame[column]
             
-            # Replace multiple consecutive spaces with single space
-            dataFrame[column] = dataFrame[column].str.replace(r'\s+', ' ', regex=True)
+            # Only mixed-type object columns need coercion; string columns are used as-is
+            if columnValues.dtype == object:
+                columnValues = columnValues.astype(str)
+            
+            # Remove leading and trailing spaces and collapse whitespace runs to one space:
+            # Arrow storage runs strip + regex as compiled kernels, while Python string
+            # storage is faster with split/join than with the per-value regex engine
+            if getattr(columnValues.dtype, 'storage', None) == 'pyarrow':
+                columnValues = columnValues.str.strip().str.replace(WHITESPACE_RUN_PATTERN, ' ', regex=True)
+            else:
+                columnValues = columnValues.map(_collapseWhitespace, na_action='ignore')
             
             # Convert 'nan' strings back to proper null values
-            dataFrame[column] = dataFrame[column].replace('nan', np.nan)
+            dataFrame[column] = columnValues.mask(columnValues == 'nan')
         
         logEntry = "Cleaned extra spaces and normalized text fields"
         self.cleaningLog.append(logEntry)
@@ -144,46 +332,20 @@ class DataCleaner:
         if self.geoColumn not in dataFrame.columns:
             return dataFrame
         
-        # ISO-3 country code mapping for standardization
-        countryMapping = {
-            'usa': 'USA',
-            'us': 'USA', 
-            'america': 'USA',
-            'united states of america': 'USA',
-            'united states': 'USA',
-            'uk': 'GBR',
-            'britain': 'GBR',
-            'great britain': 'GBR',
-            'england': 'GBR',
-            'united kingdom': 'GBR',
-            'deutschland': 'DEU',
-            'germany': 'DEU',
-            'brasil': 'BRA',
-            'brazil': 'BRA',
-            'espana': 'ESP',
-            'españa': 'ESP',
-            'spain': 'ESP',
-            'china': 'CHN',
-            'prc': 'CHN',
-            'canada': 'CAN',
-            'france': 'FRA',
-            'italia': 'ITA',
-            'italy': 'ITA',
-            'india': 'IND',
-            'japan': 'JPN',
-            'australia': 'AUS',
-            'mexico': 'MEX',
-            'netherlands': 'NLD',
-            'holland': 'NLD'
-        }
-        
-        # Apply comprehensive country name mapping
-        dataFrame[self.geoColumn] = dataFrame[self.geoColumn].str.lower().map(
-            countryMapping
-        ).fillna(dataFrame[self.geoColumn])
-        
-        # Keep ISO codes in uppercase format
-        dataFrame[self.geoColumn] = dataFrame[self.geoColumn].str.upper()
+        # Map the distinct country names only, then remap the integer codes;
+        # several raw spellings can collapse onto the same ISO code
+        countryColumn = dataFrame[self.geoColumn].astype('category')
+        mappedCountries = np.array([
+            self.countryLookup.get(country.lower()) or country.upper()
+            for country in countryColumn.cat.categories
+        ], dtype=object)
+        isoCategories = pd.Index(np.unique(mappedCountries))
+        codeRemap = np.append(isoCategories.get_indexer(mappedCountries), -1)
+        
+        # Keep ISO codes in uppercase format as a categorical column
+        dataFrame[self.geoColumn] = pd.Categorical.from_codes(
+            codeRemap[countryColumn.cat.codes.to_numpy()], categories=isoCategories
+        )
         
         logEntry = "Standardized country names to ISO-3 codes"
         self.cleaningLog.append(logEntry)
@@ -191,7 +353,7 @@ class DataCleaner:
         
         return dataFrame
     
-    def _cleanProspectStatus(self, dataFrame: pd.DataFrame) -> pd.DataFrame:
+    def _cleanProspectStatus(self, dataFrame: pd.DataFrame, keepMask: np.ndarray) -> np.ndarray:
         """
         Clean and standardize prospect status values with validation
         
@@ -202,46 +364,33 @@ class DataCleaner:
         - Ensures data consistency for analysis
         
         @param {pd.DataFrame} dataFrame - Input dataframe to process
-        @returns {pd.DataFrame} DataFrame with clean and valid status values
+        @param {np.ndarray} keepMask - Boolean mask of rows still kept
+        @returns {np.ndarray} Keep-mask narrowed to rows with valid status values
         """
         if self.statusColumn not in dataFrame.columns:
-            return dataFrame
-        
-        # Define valid status values for filtering
-        validStatuses = ['No Show', 'Registered', 'Attended', 'Responded']
-        dataFrame[self.statusColumn] = dataFrame[self.statusColumn].str.title()
-        
-        # Comprehensive status mapping for variations
-        statusMapping = {
-            'No-Show': 'No Show',
-            'Noshow': 'No Show',
-            'No_Show': 'No Show',
-            'Did Not Show': 'No Show',
-            'Absent': 'No Show',
-            'Reg': 'Registered',
-            'Registration': 'Registered',
-            'Sign Up': 'Registered',
-            'Signup': 'Registered',
-            'Attend': 'Attended',
-            'Present': 'Attended',
-            'Showed Up': 'Attended',
-            'Response': 'Responded',
-            'Reply': 'Responded',
-            'Answered': 'Responded',
-            'Feedback': 'Responded'
-        }
-        
-        # Apply status mapping for standardization
-        dataFrame[self.statusColumn] = dataFrame[self.statusColumn].map(
-            statusMapping
-        ).fillna(dataFrame[self.statusColumn])
+            return keepMask
+        
+        # Resolve each distinct raw status once with a single case-insensitive probe
+        # into a code over the valid statuses, with -1 for invalid values
+        rawCodes, rawStatuses = pd.factorize(dataFrame[self.statusColumn])
+        resolvedStatuses = [
+            self.statusLookup.get(status.lower()) if isinstance(status, str) else None
+            for status in rawStatuses
+        ]
+        codeRemap = self.statusCategories.get_indexer(resolvedStatuses).astype(np.int8)
+        
+        # Translate the per-row integer codes without touching any strings
+        if NUMBA_AVAILABLE and len(rawCodes) >= LARGE_TABLE_MIN_ROWS:
+            statusCodes = _remapCodesKernel(rawCodes, codeRemap)
+        else:
+            statusCodes = np.append(codeRemap, np.int8(-1))[rawCodes]
+        dataFrame[self.statusColumn] = pd.Categorical.from_codes(statusCodes, categories=self.statusCategories)
         
-        # Filter to keep only valid status values
-        initialCount = len(dataFrame)
-        dataFrame = dataFrame[dataFrame[self.statusColumn].isin(validStatuses)]
+        # Keep only valid status values
+        validMask = keepMask & (statusCodes >= 0)
         
-        if len(dataFrame) < initialCount:
-            removedCount = initialCount - len(dataFrame)
+        removedCount = int(keepMask.sum()) - int(validMask.sum())
+        if removedCount > 0:
             logEntry = f"Removed {removedCount} records with invalid status values"
             self.cleaningLog.append(logEntry)
             print(f"  • {logEntry}")
@@ -250,9 +399,9 @@ class DataCleaner:
         self.cleaningLog.append(logEntry)
         print(f"  • {logEntry}")
         
-        return dataFrame
+        return validMask
     
-    def _deduplicateRecords(self, dataFrame: pd.DataFrame) -> pd.DataFrame:
+    def _deduplicateRecords(self, dataFrame: pd.DataFrame, keepMask: np.ndarray) -> np.ndarray:
         """
         Remove duplicate records with intelligent sorting
         
@@ -262,27 +411,72 @@ class DataCleaner:
         - Logs deduplication results for transparency
         
         @param {pd.DataFrame} dataFrame - Input dataframe to process
-        @returns {pd.DataFrame} DataFrame without duplicate records
+        @param {np.ndarray} keepMask - Boolean mask of rows still kept
+        @returns {np.ndarray} Row positions of the deduplicated records in output order
         """
+        keptPositions = np.flatnonzero(keepMask)
         if 'Prospect ID' not in dataFrame.columns:
-            return dataFrame
+            return keptPositions
         
-        initialRows = len(dataFrame)
-        
-        # Sort by timestamp if available to preserve latest records
+        # Order kept rows latest-first from the timestamp column alone (same ordering
+        # as a frame sort on it) instead of shuffling every column in a full sort
         if 'Opt-In Timestamp' in dataFrame.columns:
-            dataFrame['Opt-In Timestamp'] = pd.to_datetime(dataFrame['Opt-In Timestamp'], errors='coerce')
-            dataFrame = dataFrame.sort_values('Opt-In Timestamp', ascending=False)
+            rowOrder = dataFrame['Opt-In Timestamp'].iloc[keptPositions].reset_index(drop=True).sort_values(
+                ascending=False
+            ).index.to_numpy()
+            keptPositions = keptPositions[rowOrder]
         
-        # Remove duplicates based on Prospect ID, keeping first (latest if sorted)
-        dataFrame = dataFrame.drop_duplicates(subset=['Prospect ID'], keep='first')
+        # Hash pass over Prospect ID keeps the first (latest) row per prospect
+        isFirstRecord = ~dataFrame['Prospect ID'].iloc[keptPositions].duplicated(keep='first').to_numpy()
         
-        if len(dataFrame) < initialRows:
-            removedCount = initialRows - len(dataFrame)
+        removedCount = len(keptPositions) - int(isFirstRecord.sum())
+        if removedCount > 0:
             logEntry = f"Deduplicated {removedCount} records by Prospect ID"
             self.cleaningLog.append(logEntry)
             print(f"  • {logEntry}")
         
+        return keptPositions[isFirstRecord]
+    
+    def _downcastNumericColumns(self, dataFrame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Downcast integer columns to the narrowest integer dtype that fits
+        
+        Integer columns are narrowed directly. Text columns are converted only when
+        every value is an integer written in canonical form, so identifiers with
+        leading zeros, signs or decimals keep their exact text in the export.
+        
+        @param {pd.DataFrame} dataFrame - Input dataframe to process
+        @returns {pd.DataFrame} DataFrame with narrowed integer columns
+        """
+        downcastColumns = []
+        
+        for column, columnType in dataFrame.dtypes.items():
+            if column in self._categoricalColumns:
+                continue
+            
+            columnValues = dataFrame[column]
+            if columnType.kind in 'iu':
+                narrowedValues = pd.to_numeric(columnValues, downcast='unsigned')
+            elif column in self._textColumns and columnValues.notna().all():
+                narrowedValues = pd.to_numeric(columnValues, errors='coerce', downcast='unsigned')
+                if narrowedValues.dtype.kind not in 'iu' or not (narrowedValues.astype(str) == columnValues).all():
+                    continue
+            else:
+                continue
+            
+            # Columns with negative values stay signed
+            if narrowedValues.dtype.kind == 'i':
+                narrowedValues = pd.to_numeric(narrowedValues, downcast='integer')
+            
+            if narrowedValues.dtype != columnType:
+                dataFrame[column] = narrowedValues
+                downcastColumns.append(column)
+        
+        if downcastColumns:
+            logEntry = f"Downcast {len(downcastColumns)} integer columns to narrow dtypes"
+            self.cleaningLog.append(logEntry)
+            print(f"  • {logEntry}")
+        
         return dataFrame
     
     def _processTimestamps(self, dataFrame: pd.DataFrame) -> pd.DataFrame:
@@ -290,23 +484,16 @@ class DataCleaner:
         Process timestamp columns and create analytical flags
         
         Handles timestamp processing:
-        - Converts timestamp strings to datetime objects
+        - Uses the timestamp columns already parsed by cleanData
         - Creates binary flags for timestamp presence
         - Enables time-based analysis capabilities
         
-        @param {pd.DataFrame} dataFrame - Input dataframe to process
+        @param {pd.DataFrame} dataFrame - Input dataframe with parsed timestamps
         @returns {pd.DataFrame} DataFrame with processed timestamps and flags
         """
-        timestampColumns = ['Opt-In Timestamp', 'Opt-Out Timestamp']
-        
-        for column in timestampColumns:
-            if column in dataFrame.columns:
-                # Convert to datetime with error handling
-                dataFrame[column] = pd.to_datetime(dataFrame[column], errors='coerce')
-                
-                # Create binary flags for analytical purposes
-                flagColumn = column.replace(' Timestamp', '').replace('-', '_').lower() + '_flag'
-                dataFrame[flagColumn] = dataFrame[column].notna().astype(int)
+        for column, flagColumn in self._timestampFlags:
+            # Create binary flags for analytical purposes (1 byte per row)
+            dataFrame[flagColumn] = dataFrame[column].notna().to_numpy().view(np.int8)
         
         logEntry = "Processed timestamp fields and created analytical binary flags"
         self.cleaningLog.append(logEntry)
@@ -314,14 +501,43 @@ class DataCleaner:
         
         return dataFrame
     
-    def exportCleanedData(self, originalFilePath: Optional[str] = None) -> str:
+    def _parseTimestamps(self, timestampValues: pd.Series) -> pd.Series:
+        """
+        Parse a timestamp column with the known format on the C fast path
+        
+        Columns that are already datetime64 are returned as-is. Values that do
+        not match the expected format fall back to inferred parsing, so inputs
+        with other layouts keep converting as before.
+        
+        @param {pd.Series} timestampValues - Raw timestamp column
+        @returns {pd.Series} Parsed datetime column with NaT for invalid values
+        """
+        if pd.api.types.is_datetime64_any_dtype(timestampValues):
+            return timestampValues
+        
+        parsedValues = pd.to_datetime(timestampValues, format=self.timestampFormat, errors='coerce', cache=True)
+        unparsedMask = parsedValues.isna() & timestampValues.notna()
+        if unparsedMask.any():
+            # Per-value format inference is the intended fallback here
+            with warnings.catch_warnings():
+                warnings.filterwarnings('ignore', message='Could not infer format', category=UserWarning)
+                parsedValues[unparsedMask] = pd.to_datetime(timestampValues[unparsedMask], errors='coerce')
+        
+        return parsedValues
+    
+    def exportCleanedData(self, originalFilePath: Optional[str] = None, engine: str = 'pandas',
+                          verbose: bool = True) -> str:
         """
         Export cleaned data to CSV in generated directory
         
         Always saves cleaned data to the generated/ directory with 'clean_' prefix.
         Creates directory structure if needed and exports with proper encoding.
+        The 'pyarrow' engine streams the file through Arrow's multi-threaded CSV
+        writer, which quotes all text fields and writes full-precision timestamps.
         
         @param {str} originalFilePath - Original file path to derive naming from
+        @param {str} engine - CSV writer to use: 'pandas' (default) or 'pyarrow'
+        @param {bool} verbose - Print the export confirmation (disable when exporting in the background)
         @returns {str} Path to the exported cleaned CSV file
         """
         if self.cleanedData is None:
@@ -345,8 +561,15 @@ class DataCleaner:
         outputPath = os.path.join("generated", outputFilename)
         
         # Export to CSV with proper encoding
-        self.cleanedData.to_csv(outputPath, index=False)
-        print(f"✅ Cleaned data exported successfully: {outputPath}")
+        if engine == 'pyarrow' and PYARROW_AVAILABLE:
+            arrowTable = pyarrow.Table.from_pandas(self.cleanedData, preserve_index=False)
+            pacsv.write_csv(arrowTable, outputPath)
+        else:
+            if engine == 'pyarrow':
+                print("⚠️  pyarrow not available, exporting with pandas CSV writer")
+            self.cleanedData.to_csv(outputPath, index=False)
+        if verbose:
+            print(f"✅ Cleaned data exported successfully: {outputPath}")
         
         return outputPath
     
@@ -366,11 +589,11 @@ class DataCleaner:
             return {}
         
         summaryData = {
-            'originalRecords': len(self.rawData),
+            'originalRecords': self._rawShape[0],
             'cleanedRecords': len(self.cleanedData),
-            'recordsRemoved': len(self.rawData) - len(self.cleanedData),
+            'recordsRemoved': self._rawShape[0] - len(self.cleanedData),
             'removalPercentage': round(
-                ((len(self.rawData) - len(self.cleanedData)) / len(self.rawData) * 100), 2
+                ((self._rawShape[0] - len(self.cleanedData)) / self._rawShape[0] * 100), 2
             ),
             'cleaningSteps': self.cleaningLog,
             'dataQualityImprovement': self._calculateQualityImprovement()
@@ -389,15 +612,15 @@ class DataCleaner:
         
         @returns {Dict[str, Any]} Detailed quality improvement metrics
         """
-        if self.rawData is None or self.cleanedData is None:
+        if self._rawMissing is None or self.cleanedData is None:
             return {}
         
-        # Calculate missing data metrics for comparison
-        rawMissing = self.rawData.isnull().sum().sum()
-        cleanedMissing = self.cleanedData.isnull().sum().sum()
+        # Calculate missing data metrics for comparison (raw count captured while cleaning)
+        rawMissing = self._rawMissing
+        cleanedMissing = int(self.cleanedData.isnull().to_numpy().sum())
         
         # Calculate completeness percentages before and after
-        rawCompleteness = (1 - rawMissing / (len(self.rawData) * len(self.rawData.columns))) * 100
+        rawCompleteness = (1 - rawMissing / (self._rawShape[0] * self._rawShape[1])) * 100
         cleanedCompleteness = (1 - cleanedMissing / (len(self.cleanedData) * len(self.cleanedData.columns))) * 100
         
         return {
@@ -430,6 +653,7 @@ class DataCleaner:
         print(f"📊 Original records: {summaryData['originalRecords']:,}")
         print(f"✅ Cleaned records: {summaryData['cleanedRecords']:,}")
         print(f"🗑️  Records removed: {summaryData['recordsRemoved']:,} ({summaryData['removalPercentage']}%)")
+        print(f"💾 Cleaned data memory: {self.cleanedData.memory_usage(deep=True).sum() / 1024 / 1024:.1f} MB")
         
         # Display quality improvement metrics
         qualityData = summaryData.get('dataQualityImprovement', {})
@@ -7,16 +7,45 @@ Usage: python3 main.py [company_name] [objective]
 
 import sys
 import os
+import logging
 from typing import Tuple, Optional, Dict, Any
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# Import our custom modules
-from validation import DataValidator
-from clean import DataCleaner
-from transform import DataTransformer
-from analysis import DataAnalyzer
-from generate import ReportGenerator
+# Pipeline modules (pandas, numba, PDF toolchain) are imported inside the step
+# that uses them, so usage errors and a missing data file exit immediately
+
+# Console box drawing shared by the pipeline summaries
+BOX_RULE = "═" * 78
+BOX_BOTTOM = "└" + "─" * 77 + "┘"
+BOX_ROW = "│ {:<77}│".format
+
+# Step banners, built once since they depend on no runtime state
+STEP_BANNER_TOP = "┌" + "─" * 77 + "┐\n"
+STEP_BANNERS = {
+    'validation': STEP_BANNER_TOP + "│                          📋 STEP 1: DATA VALIDATION                        │\n" + BOX_BOTTOM + "\n",
+    'cleaning': STEP_BANNER_TOP + "│                           🧹 STEP 2: DATA CLEANING                         │\n" + BOX_BOTTOM + "\n",
+    'transformation': STEP_BANNER_TOP + "│                        🔄 STEP 3: DATA TRANSFORMATION                      │\n" + BOX_BOTTOM + "\n",
+    'analysis': STEP_BANNER_TOP + "│                          📊 STEP 4: DATA ANALYSIS                          │\n" + BOX_BOTTOM + "\n",
+    'generation': STEP_BANNER_TOP + "│                        📝 STEP 5: REPORT GENERATION                        │\n" + BOX_BOTTOM + "\n",
+}
+
+# Pipeline steps in execution order, as (stepName, methodName, label)
+PIPELINE_STEPS = (
+    ('validation', '_executeDataValidation', 'Data validation'),
+    ('cleaning', '_executeDataCleaning', 'Data cleaning'),
+    ('transformation', '_executeDataTransformation', 'Data transformation'),
+    ('analysis', '_executeDataAnalysis', 'Data analysis'),
+    ('generation', '_executeReportGeneration', 'Report generation'),
+)
+
+# Step timings are kept as integer perf_counter_ns() readings
+NANOSECONDS_PER_SECOND = 1_000_000_000
+
+# Background workers for pipeline I/O that later steps do not depend on
+IO_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='pipeline-io')
 
 
 class MarketingReportPipeline:
@@ -53,11 +82,15 @@ class MarketingReportPipeline:
         self._analysisResults = {}
         self._insights = {}
         self._recommendations = []
+        self._reportPaths = (None, None)
         
         # Performance monitoring
-        self._startTime = None
-        self._stepTimes = {}
+        self._startTimeNs = None
+        self._stepTimes = {}  # step name -> duration in nanoseconds
         self._pipelineMetrics = {}
+        
+        # Background I/O started by a step, as (description, future) pairs
+        self._pendingIO = []
     
     def runCompletePipeline(self) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -68,25 +101,20 @@ class MarketingReportPipeline:
         
         @returns {Tuple[str|None, str|None]} Tuple of (markdownPath, pdfPath)
         """
-        self._startTime = time.time()
+        self._startTimeNs = time.perf_counter_ns()
         self._printPipelineHeader()
         
         try:
-            # Execute pipeline steps with comprehensive monitoring
-            if not self._executeDataValidation():
-                return None, None
-            
-            if not self._executeDataCleaning():
-                return None, None
-            
-            if not self._executeDataTransformation():
-                return None, None
+            # Execute pipeline steps in order, stopping at the first failure
+            for stepName, methodName, label in PIPELINE_STEPS:
+                if not self._runStep(stepName, getattr(self, methodName), label):
+                    self._settlePendingIO()
+                    return None, None
             
-            if not self._executeDataAnalysis():
-                return None, None
+            markdownPath, pdfPath = self._reportPaths
             
-            # Generate final reports
-            markdownPath, pdfPath = self._executeReportGeneration()
+            # Finish background exports before reporting success
+            self._awaitPendingIO()
             
             # Display comprehensive success summary
             self._printSuccessSummary(markdownPath, pdfPath)
@@ -94,8 +122,79 @@ class MarketingReportPipeline:
             return markdownPath, pdfPath
             
         except Exception as e:
+            self._settlePendingIO()
             self._printErrorSummary(str(e))
             return None, None
+        
+        finally:
+            self._pendingIO.clear()
+    
+    def _runStep(self, stepName: str, stepMethod, label: str) -> bool:
+        """
+        Run one pipeline step with its banner, timing and error reporting
+        
+        @param {str} stepName - Key of the step in the banners and step times
+        @param {Callable[[], bool]} stepMethod - Step body, returning True on success
+        @param {str} label - Human readable step name used in status messages
+        @returns {bool} True if the step succeeded, False otherwise
+        """
+        stepStartNs = time.perf_counter_ns()
+        sys.stdout.write(STEP_BANNERS[stepName])
+        
+        try:
+            if not stepMethod():
+                return False
+        except Exception as e:
+            print(f"❌ {label} failed with error: {str(e)}")
+            return False
+        
+        # Log performance metrics
+        self._stepTimes[stepName] = time.perf_counter_ns() - stepStartNs
+        print(f"✅ {label} completed successfully ({self._stepTimes[stepName] / NANOSECONDS_PER_SECOND:.2f}s)")
+        return True
+    
+    def _elapsedSeconds(self) -> float:
+        """
+        Get the time elapsed since the pipeline started
+        
+        @returns {float} Elapsed seconds, or 0 if the pipeline has not started
+        """
+        if self._startTimeNs is None:
+            return 0
+        return (time.perf_counter_ns() - self._startTimeNs) / NANOSECONDS_PER_SECOND
+    
+    def _stepTimesInSeconds(self) -> Dict[str, float]:
+        """
+        Convert the recorded step durations to seconds for display
+        
+        @returns {Dict[str, float]} Step durations in seconds, in execution order
+        """
+        return {step: duration / NANOSECONDS_PER_SECOND for step, duration in self._stepTimes.items()}
+    
+    def _awaitPendingIO(self) -> None:
+        """
+        Wait for background I/O started by earlier steps and report its results
+        
+        @raises {Exception} Re-raises the first failure of a background task
+        """
+        # Pop one task at a time so tasks behind a failure stay pending for _settlePendingIO
+        while self._pendingIO:
+            description, ioFuture = self._pendingIO.pop(0)
+            print(f"✅ {description}: {ioFuture.result()}")
+    
+    def _settlePendingIO(self) -> None:
+        """
+        Let background I/O finish after a failed run and report its outcome
+        
+        Exports started by completed steps are still valid, so they are waited
+        for rather than dropped; their errors are printed instead of raised.
+        """
+        while self._pendingIO:
+            description, ioFuture = self._pendingIO.pop(0)
+            try:
+                print(f"✅ {description}: {ioFuture.result()}")
+            except Exception as e:
+                print(f"❌ Background I/O failed with error: {str(e)}")
     
     def _printPipelineHeader(self) -> None:
         """
@@ -104,15 +203,17 @@ class MarketingReportPipeline:
         Shows detailed pipeline configuration, data source information,
         and execution context for complete transparency.
         """
-        print("\n" + "╔" + "═" * 78 + "╗")
-        print(f"║{f'🚀 MARKETING REPORT GENERATOR - {self.companyName.upper()}':^78}║")
-        print("╠" + "═" * 78 + "╣")
-        print(f"║ 📁 Data Source: {self.filePath:<58} ║")
-        print(f"║ 🏢 Company: {self.companyName:<63} ║")
-        print(f"║ 🎯 Objective: {self.objective:<61} ║")
-        print(f"║ ⏰ Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S'):<63} ║")
-        print("╚" + "═" * 78 + "╝")
-        print()
+        headerTitle = f"🚀 MARKETING REPORT GENERATOR - {self.companyName.upper()}"
+        sys.stdout.write(
+            f"\n╔{BOX_RULE}╗\n"
+            f"║{headerTitle:^78}║\n"
+            f"╠{BOX_RULE}╣\n"
+            f"║ 📁 Data Source: {self.filePath:<58} ║\n"
+            f"║ 🏢 Company: {self.companyName:<63} ║\n"
+            f"║ 🎯 Objective: {self.objective:<61} ║\n"
+            f"║ ⏰ Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S'):<63} ║\n"
+            f"╚{BOX_RULE}╝\n\n"
+        )
     
     def _executeDataValidation(self) -> bool:
         """
@@ -123,42 +224,52 @@ class MarketingReportPipeline:
         
         @returns {bool} True if validation successful, False otherwise
         """
-        stepStart = time.time()
-        print("┌─────────────────────────────────────────────────────────────────────────────┐")
-        print("│                          📋 STEP 1: DATA VALIDATION                        │")
-        print("└─────────────────────────────────────────────────────────────────────────────┘")
+        from validation import DataValidator
         
-        try:
-            # Initialize validator with configuration
-            self._validator = DataValidator(self.filePath)
-            
-            # Load and validate data
-            if not self._validator.loadData():
-                print("❌ Failed to load data file")
-                return False
-            
-            # Perform comprehensive structure validation
-            validationResults = self._validator.validateStructure()
-            
-            if not validationResults['valid']:
-                errorMsg = validationResults.get('error', 'Unknown validation error')
-                print(f"❌ Data validation failed: {errorMsg}")
-                return False
-            
-            # Display detailed validation report
-            self._validator.printValidationReport()
-            
-            # Extract validated data for next step
-            self._rawData = self._validator.getDataFrame()
-            
-            # Log performance metrics
-            self._stepTimes['validation'] = time.time() - stepStart
-            print(f"✅ Data validation completed successfully ({self._stepTimes['validation']:.2f}s)")
+        # Initialize validator with configuration
+        self._validator = DataValidator(self.filePath)
+        
+        # Load data, reusing the Parquet copy of an unchanged source file
+        if not self._loadValidatorData():
+            print("❌ Failed to load data file")
+            return False
+        
+        # Perform comprehensive structure validation
+        validationResults = self._validator.validateStructure()
+        
+        if not validationResults['valid']:
+            errorMsg = validationResults.get('error', 'Unknown validation error')
+            print(f"❌ Data validation failed: {errorMsg}")
+            return False
+        
+        # Display detailed validation report
+        self._validator.printValidationReport()
+        
+        # Extract validated data for next step
+        self._rawData = self._validator.getDataFrame()
+        return True
+    
+    def _loadValidatorData(self) -> bool:
+        """
+        Load the source file through the Parquet cache when possible
+        
+        A cache hit skips Excel/CSV parsing entirely; on a miss the source is
+        parsed as usual and its Parquet copy is written for the next run.
+        
+        @returns {bool} True if data loaded successfully, False otherwise
+        """
+        if not os.path.exists(self.filePath):
+            return self._validator.loadData()
+        
+        cachePath = self._validator.getParquetCachePath()
+        if os.path.exists(cachePath) and self._validator.loadFromParquet(cachePath):
             return True
-            
-        except Exception as e:
-            print(f"❌ Data validation failed with error: {str(e)}")
+        
+        if not self._validator.loadData():
             return False
+        
+        self._validator.saveToParquet(cachePath)
+        return True
     
     def _executeDataCleaning(self) -> bool:
         """
@@ -169,37 +280,28 @@ class MarketingReportPipeline:
         
         @returns {bool} True if cleaning successful, False otherwise
         """
-        stepStart = time.time()
-        print("┌─────────────────────────────────────────────────────────────────────────────┐")
-        print("│                           🧹 STEP 2: DATA CLEANING                         │")
-        print("└─────────────────────────────────────────────────────────────────────────────┘")
-        
-        try:
-            # Validate raw data availability
-            if self._rawData is None:
-                print("❌ No raw data available for cleaning")
-                return False
-            
-            # Initialize cleaner with raw data
-            self._cleaner = DataCleaner(self._rawData)
-            
-            # Execute comprehensive cleaning process
-            self._cleanedData = self._cleaner.cleanData()
-            
-            # Export cleaned data for archival
-            cleanedCsvPath = self._cleaner.exportCleanedData(self.filePath)
-            
-            # Display detailed cleaning report
-            self._cleaner.printCleaningReport()
-            
-            # Log performance metrics
-            self._stepTimes['cleaning'] = time.time() - stepStart
-            print(f"✅ Data cleaning completed successfully ({self._stepTimes['cleaning']:.2f}s)")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Data cleaning failed with error: {str(e)}")
+        # Validate raw data availability
+        if self._rawData is None:
+            print("❌ No raw data available for cleaning")
             return False
+        
+        from clean import DataCleaner
+        
+        # Initialize cleaner with raw data
+        self._cleaner = DataCleaner(self._rawData)
+        
+        # Execute comprehensive cleaning process
+        self._cleanedData = self._cleaner.cleanData()
+        
+        # Export cleaned data for archival in the background while later steps run
+        self._pendingIO.append((
+            "Cleaned data exported successfully",
+            IO_EXECUTOR.submit(self._cleaner.exportCleanedData, self.filePath, verbose=False)
+        ))
+        
+        # Display detailed cleaning report
+        self._cleaner.printCleaningReport()
+        return True
     
     def _executeDataTransformation(self) -> bool:
         """
@@ -210,34 +312,22 @@ class MarketingReportPipeline:
         
         @returns {bool} True if transformation successful, False otherwise
         """
-        stepStart = time.time()
-        print("┌─────────────────────────────────────────────────────────────────────────────┐")
-        print("│                        🔄 STEP 3: DATA TRANSFORMATION                      │")
-        print("└─────────────────────────────────────────────────────────────────────────────┘")
-        
-        try:
-            # Validate cleaned data availability
-            if self._cleanedData is None:
-                print("❌ No cleaned data available for transformation")
-                return False
-            
-            # Initialize transformer with cleaned data
-            self._transformer = DataTransformer(self._cleanedData)
-            
-            # Execute comprehensive transformation process
-            self._transformedData = self._transformer.transformData()
-            
-            # Display detailed transformation report
-            self._transformer.printTransformationReport()
-            
-            # Log performance metrics
-            self._stepTimes['transformation'] = time.time() - stepStart
-            print(f"✅ Data transformation completed successfully ({self._stepTimes['transformation']:.2f}s)")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Data transformation failed with error: {str(e)}")
+        # Validate cleaned data availability
+        if self._cleanedData is None:
+            print("❌ No cleaned data available for transformation")
             return False
+        
+        from transform import DataTransformer
+        
+        # Initialize transformer with cleaned data
+        self._transformer = DataTransformer(self._cleanedData)
+        
+        # Execute comprehensive transformation process
+        self._transformedData = self._transformer.transformData()
+        
+        # Display detailed transformation report
+        self._transformer.printTransformationReport()
+        return True
     
     def _executeDataAnalysis(self) -> bool:
         """
@@ -248,82 +338,58 @@ class MarketingReportPipeline:
         
         @returns {bool} True if analysis successful, False otherwise
         """
-        stepStart = time.time()
-        print("┌─────────────────────────────────────────────────────────────────────────────┐")
-        print("│                          📊 STEP 4: DATA ANALYSIS                          │")
-        print("└─────────────────────────────────────────────────────────────────────────────┘")
-        
-        try:
-            # Validate transformed data availability
-            if self._transformedData is None:
-                print("❌ No transformed data available for analysis")
-                return False
-            
-            # Initialize analyzer with configuration
-            self._analyzer = DataAnalyzer(
-                self._transformedData, 
-                self.companyName, 
-                self.objective
-            )
-            
-            # Execute comprehensive analysis process
-            self._analysisResults = self._analyzer.performCompleteAnalysis()
-            self._insights = self._analyzer.insights
-            self._recommendations = self._analyzer.recommendations
-            
-            # Display detailed analysis summary
-            self._analyzer.printAnalysisSummary()
-            
-            # Log performance metrics
-            self._stepTimes['analysis'] = time.time() - stepStart
-            print(f"✅ Data analysis completed successfully ({self._stepTimes['analysis']:.2f}s)")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Data analysis failed with error: {str(e)}")
+        # Validate transformed data availability
+        if self._transformedData is None:
+            print("❌ No transformed data available for analysis")
             return False
+        
+        from analysis import DataAnalyzer
+        
+        # Initialize analyzer with configuration
+        self._analyzer = DataAnalyzer(
+            self._transformedData, 
+            self.companyName, 
+            self.objective
+        )
+        
+        # Execute comprehensive analysis process
+        self._analysisResults = self._analyzer.performCompleteAnalysis()
+        self._insights = self._analyzer.insights
+        self._recommendations = self._analyzer.recommendations
+        
+        # Display detailed analysis summary
+        self._analyzer.printAnalysisSummary()
+        return True
     
-    def _executeReportGeneration(self) -> Tuple[Optional[str], Optional[str]]:
+    def _executeReportGeneration(self) -> bool:
         """
         Execute report generation step with comprehensive output creation
         
         Generates professional reports in multiple formats with detailed
         formatting, visualizations, and executive-ready presentations.
+        The (markdownPath, pdfPath) tuple is kept in self._reportPaths.
         
-        @returns {Tuple[str|None, str|None]} Tuple of (markdownPath, pdfPath)
+        @returns {bool} True once report generation has run
         """
-        stepStart = time.time()
-        print("┌─────────────────────────────────────────────────────────────────────────────┐")
-        print("│                        📝 STEP 5: REPORT GENERATION                        │")
-        print("└─────────────────────────────────────────────────────────────────────────────┘")
-        
-        try:
-            # Initialize generator with configuration
-            self._generator = ReportGenerator(
-                self.companyName, 
-                self.objective, 
-                self.filePath
-            )
-            
-            # Set comprehensive analysis data
-            self._generator.setAnalysisData(
-                self._analysisResults,
-                self._insights,
-                self._recommendations
-            )
-            
-            # Generate complete professional reports
-            markdownPath, pdfPath = self._generator.generateCompleteReport()
-            
-            # Log performance metrics
-            self._stepTimes['generation'] = time.time() - stepStart
-            print(f"✅ Report generation completed successfully ({self._stepTimes['generation']:.2f}s)")
-            
-            return markdownPath, pdfPath
-            
-        except Exception as e:
-            print(f"❌ Report generation failed with error: {str(e)}")
-            return None, None
+        from generate import ReportGenerator
+        
+        # Initialize generator with configuration
+        self._generator = ReportGenerator(
+            self.companyName, 
+            self.objective, 
+            self.filePath
+        )
+        
+        # Set comprehensive analysis data
+        self._generator.setAnalysisData(
+            self._analysisResults,
+            self._insights,
+            self._recommendations
+        )
+        
+        # Generate complete professional reports
+        self._reportPaths = self._generator.generateCompleteReport()
+        return True
     
     def _printSuccessSummary(self, markdownPath: Optional[str], pdfPath: Optional[str]) -> None:
         """
@@ -335,39 +401,43 @@ class MarketingReportPipeline:
         @param {str|None} markdownPath - Generated markdown file path
         @param {str|None} pdfPath - Generated PDF file path
         """
-        totalTime = time.time() - self._startTime if self._startTime is not None else 0
+        totalTime = self._elapsedSeconds()
         
-        print("\n╔" + "═" * 78 + "╗")
-        print("║" + "🎉 PIPELINE COMPLETED SUCCESSFULLY!".center(78) + "║")
-        print("╚" + "═" * 78 + "╝")
+        summaryLines = [
+            f"\n╔{BOX_RULE}╗",
+            "║" + "🎉 PIPELINE COMPLETED SUCCESSFULLY!".center(78) + "║",
+            f"╚{BOX_RULE}╝"
+        ]
         
         # Display output files
         if markdownPath:
-            print(f"📄 Markdown Report: {markdownPath}")
+            summaryLines.append(f"📄 Markdown Report: {markdownPath}")
         
         if pdfPath:
-            print(f"📋 PDF Report: {pdfPath}")
-            print("🎯 Ready for executive presentation! (Markdown + PDF)")
+            summaryLines.append(f"📋 PDF Report: {pdfPath}")
+            summaryLines.append("🎯 Ready for executive presentation! (Markdown + PDF)")
         else:
-            print("🎯 Ready for executive presentation! (Markdown only)")
-            print("   📄 PDF generation may have failed - but markdown report is ready")
+            summaryLines.append("🎯 Ready for executive presentation! (Markdown only)")
+            summaryLines.append("   📄 PDF generation may have failed - but markdown report is ready")
         
         # Display performance metrics
-        print(f"\n┌─── ⏱️  PERFORMANCE METRICS ────────────────────────────────────────────────┐")
-        print(f"│ Total execution time: {totalTime:.2f}s{' ' * (78 - 25 - len(f'{totalTime:.2f}s'))}│")
-        for step, duration in self._stepTimes.items():
+        summaryLines.append("\n┌─── ⏱️  PERFORMANCE METRICS ────────────────────────────────────────────────┐")
+        summaryLines.append(BOX_ROW(f"Total execution time: {totalTime:.2f}s"))
+        for step, duration in self._stepTimesInSeconds().items():
             percentage = (duration / totalTime) * 100 if totalTime > 0 else 0
-            line = f"│ {step.title()}: {duration:.2f}s ({percentage:.1f}%)"
-            print(f"{line}{' ' * (79 - len(line))}│")
-        print("└─────────────────────────────────────────────────────────────────────────────┘")
+            summaryLines.append(BOX_ROW(f"{step.title()}: {duration:.2f}s ({percentage:.1f}%)"))
+        summaryLines.append(BOX_BOTTOM)
+        sys.stdout.write("\n".join(summaryLines) + "\n")
         
         # Display key business metrics
         self._displayBusinessMetrics()
         
-        print(f"\n┌─────────────────────────────────────────────────────────────────────────────┐")
-        print(f"│ ✨ Analysis complete at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{' ' * (78 - 24 - 19)}│")
-        print(f"│ 🚀 Insights ready for strategic decision-making!{' ' * (78 - 42)}│")
-        print(f"└─────────────────────────────────────────────────────────────────────────────┘")
+        sys.stdout.write(
+            "\n┌" + "─" * 77 + "┐\n"
+            + BOX_ROW(f"✨ Analysis complete at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}") + "\n"
+            + BOX_ROW("🚀 Insights ready for strategic decision-making!") + "\n"
+            + BOX_BOTTOM + "\n"
+        )
     
     def _displayBusinessMetrics(self) -> None:
         """
@@ -379,7 +449,7 @@ class MarketingReportPipeline:
         if not self._analysisResults:
             return
         
-        print(f"\n┌─── 📊 KEY BUSINESS METRICS ────────────────────────────────────────────────┐")
+        metricRows = ["\n┌─── 📊 KEY BUSINESS METRICS ────────────────────────────────────────────────┐"]
         
         # Funnel performance metrics
         if 'funnel' in self._analysisResults:
@@ -388,12 +458,9 @@ class MarketingReportPipeline:
             conversionRate = funnelData.get('overallConversionRate', 0)
             targetConversions = funnelData.get('targetConversions', 0)
             
-            line1 = f"│ Total prospects analyzed: {totalProspects:,}"
-            print(f"{line1}{' ' * (79 - len(line1))}│")
-            line2 = f"│ Overall conversion rate: {conversionRate}%"
-            print(f"{line2}{' ' * (79 - len(line2))}│")
-            line3 = f"│ Target conversions: {targetConversions}"
-            print(f"{line3}{' ' * (79 - len(line3))}│")
+            metricRows.append(BOX_ROW(f"Total prospects analyzed: {totalProspects:,}"))
+            metricRows.append(BOX_ROW(f"Overall conversion rate: {conversionRate}%"))
+            metricRows.append(BOX_ROW(f"Target conversions: {targetConversions}"))
         
         # Channel performance metrics
         if 'channels' in self._analysisResults:
@@ -401,22 +468,26 @@ class MarketingReportPipeline:
             if len(channelsData) > 0:
                 bestChannel = channelsData.index[0]
                 bestRate = channelsData.iloc[0]['conversionRate']
-                line4 = f"│ Best performing channel: {bestChannel} ({bestRate}%)"
-                print(f"{line4}{' ' * (79 - len(line4))}│")
+                metricRows.append(BOX_ROW(f"Best performing channel: {bestChannel} ({bestRate}%)"))
         
         # Recommendations summary
         if self._recommendations:
-            highPriorityRecs = [r for r in self._recommendations if r.get('priority') == 'HIGH']
-            mediumPriorityRecs = [r for r in self._recommendations if r.get('priority') == 'MEDIUM']
+            priorityCounts = self._countRecommendationPriorities()
             
-            line5 = f"│ High priority recommendations: {len(highPriorityRecs)}"
-            print(f"{line5}{' ' * (79 - len(line5))}│")
-            line6 = f"│ Medium priority recommendations: {len(mediumPriorityRecs)}"
-            print(f"{line6}{' ' * (79 - len(line6))}│")
-            line7 = f"│ Total actionable recommendations: {len(self._recommendations)}"
-            print(f"{line7}{' ' * (79 - len(line7))}│")
-        
-        print("└─────────────────────────────────────────────────────────────────────────────┘")
+            metricRows.append(BOX_ROW(f"High priority recommendations: {priorityCounts['HIGH']}"))
+            metricRows.append(BOX_ROW(f"Medium priority recommendations: {priorityCounts['MEDIUM']}"))
+            metricRows.append(BOX_ROW(f"Total actionable recommendations: {len(self._recommendations)}"))
+        
+        metricRows.append(BOX_BOTTOM)
+        sys.stdout.write("\n".join(metricRows) + "\n")
+    
+    def _countRecommendationPriorities(self) -> Counter:
+        """
+        Count recommendations per priority level in a single pass
+        
+        @returns {Counter} Recommendation counts keyed by priority (0 when absent)
+        """
+        return Counter(recommendation.get('priority') for recommendation in self._recommendations)
     
     def _printErrorSummary(self, errorMessage: str) -> None:
         """
@@ -427,7 +498,7 @@ class MarketingReportPipeline:
         
         @param {str} errorMessage - Error message to display
         """
-        totalTime = (time.time() - self._startTime) if self._startTime is not None else 0
+        totalTime = self._elapsedSeconds()
         
         print("\n❌ PIPELINE EXECUTION FAILED!")
         print("=" * 80)
@@ -437,7 +508,7 @@ class MarketingReportPipeline:
         # Show completed steps
         if self._stepTimes:
             print(f"\n✅ Completed steps:")
-            for step, duration in self._stepTimes.items():
+            for step, duration in self._stepTimesInSeconds().items():
                 print(f"  • {step.title()}: {duration:.2f}s")
         
         print(f"\n🔧 Troubleshooting suggestions:")
@@ -460,12 +531,12 @@ class MarketingReportPipeline:
             'objective': self.objective,
             'dataSource': self.filePath,
             'pipelineStatus': 'completed',
-            'executionTime': sum(self._stepTimes.values()) if self._stepTimes else 0,
-            'stepTimes': self._stepTimes,
+            'executionTime': sum(self._stepTimes.values()) / NANOSECONDS_PER_SECOND,
+            'stepTimes': self._stepTimesInSeconds(),
             'dataQuality': {},
             'analysisSummary': {},
             'recommendationsCount': len(self._recommendations),
-            'highPriorityRecommendations': len([r for r in self._recommendations if r.get('priority') == 'HIGH'])
+            'highPriorityRecommendations': self._countRecommendationPriorities()['HIGH']
         }
         
         # Add data quality metrics
@@ -512,6 +583,9 @@ def main():
         print("   Expected location: data/analytics-case-study-data-8.xlsx")
         sys.exit(1)
     
+    # Show report generation progress alongside the pipeline output
+    _configureReportLogging()
+    
     # Create and execute pipeline with comprehensive monitoring
     pipeline = MarketingReportPipeline(dataFile, companyName, objective)
     markdownPath, pdfPath = pipeline.runCompletePipeline()
@@ -523,6 +597,22 @@ def main():
         sys.exit(1)  # Failure
 
 
+def _configureReportLogging() -> None:
+    """
+    Route report generator progress messages to stdout for command line runs
+    
+    The generate module logs through its own logger so library and batch callers
+    can silence it; the command line keeps the plain progress output.
+    """
+    reportHandler = logging.StreamHandler(sys.stdout)
+    reportHandler.setFormatter(logging.Formatter('%(message)s'))
+    
+    reportLogger = logging.getLogger('generate')
+    reportLogger.addHandler(reportHandler)
+    reportLogger.setLevel(logging.INFO)
+    reportLogger.propagate = False
+
+
 def _displayUsageInformation(dataFile: str) -> None:
     """
     Display usage information
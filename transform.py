@@ -4,11 +4,142 @@ Data Transformation Module - ABC Inc. Marketing Report Generator
 Handles specific data transformations, categorizations, and feature engineering with enhanced structure
 """
 
+import re
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
+# Optional numexpr import for the fused engagement score expression
+try:
+    import numexpr
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+# Optional numba import for the parallel label expansion kernel
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Minimum table size before numexpr/numba pay off their compile and threading overhead
+LARGE_TABLE_MIN_ROWS = 100_000
+
+# Engagement score weights over the funnel flags, evaluated in a single pass
+ENGAGEMENT_SCORE_EXPRESSION = 'isRegistered * 4 + isAttended * 3 + isResponded * 2 + (1 - isNoShow)'
+
+# Funnel flag columns and the prospect status each one marks
+FUNNEL_FLAG_STATUSES = (
+    ('isRegistered', 'Registered'),
+    ('isAttended', 'Attended'),
+    ('isResponded', 'Responded'),
+    ('isNoShow', 'No Show'),
+)
+
+# Value potential score per job category, based on job authority
+VALUE_POTENTIAL_SCORES = {
+    'Executive': 5,      # Highest value - decision makers
+    'Decision Maker': 4, # High value - budget authority
+    'Practitioner': 3,   # Medium value - end users
+    'Other': 2          # Lower value - unclear authority
+}
+DEFAULT_VALUE_POTENTIAL = 2
+
+# Job title keywords per authority level, checked in order of precedence
+JOB_CATEGORY_KEYWORDS = (
+    # Executive keywords - highest authority level (C-suite, VP+, Founders)
+    ('Executive', (
+        'president', 'ceo', 'cto', 'cmo', 'cfo', 'coo', 'cso', 'cro',
+        'vp', 'vice president', 'chief', 'founder', 'co-founder',
+        'owner', 'partner', 'board', 'chairman', 'chairwoman'
+    )),
+    # Decision Maker keywords - budget and strategic authority
+    ('Decision Maker', (
+        'manager', 'director', 'head', 'lead', 'supervisor',
+        'team lead', 'senior manager', 'general manager', 'regional manager',
+        'product manager', 'project manager', 'program manager'
+    )),
+    # Practitioner keywords - individual contributors and specialists
+    ('Practitioner', (
+        'analyst', 'specialist', 'engineer', 'coordinator', 'associate',
+        'junior', 'assistant', 'intern', 'trainee', 'consultant',
+        'developer', 'designer', 'researcher', 'administrator'
+    )),
+)
+
+# Channel keywords per strategic group, checked in order of precedence
+CHANNEL_GROUP_KEYWORDS = (
+    ('Paid Media', ('advertisement', 'ad', 'paid', 'ppc', 'adwords')),
+    ('Social Media', ('social', 'facebook', 'linkedin', 'twitter')),
+    ('Referral', ('referral', 'word of mouth', 'recommendation')),
+    ('Events', ('trade show', 'event', 'conference', 'webinar')),
+    ('Content Marketing', ('content', 'blog', 'seo', 'organic')),
+    ('Email Marketing', ('email', 'newsletter', 'campaign')),
+)
+
+# Lowercase country names per geographic region (exact matches)
+GEOGRAPHIC_REGION_COUNTRIES = (
+    ('North America', frozenset({'united states', 'canada', 'mexico'})),
+    ('Europe', frozenset({'united kingdom', 'germany', 'france', 'italy', 'spain', 'netherlands'})),
+    ('Asia Pacific', frozenset({'china', 'japan', 'india', 'australia', 'singapore'})),
+    ('Latin America', frozenset({'brazil', 'argentina', 'chile', 'colombia'})),
+)
+
+# Job title keywords per seniority level, checked in order of precedence
+SENIORITY_KEYWORDS = (
+    ('Senior', ('senior', 'sr', 'lead', 'principal', 'chief')),
+    ('Junior', ('junior', 'jr', 'associate', 'intern', 'trainee')),
+)
+
+# Seniority abbreviations that only count as whole words ('sr' must not match 'msrp')
+SENIORITY_WHOLE_WORD_KEYWORDS = frozenset({'sr', 'jr'})
+
+
+def _compileKeywordRules(keywordRules: Tuple, wholeWordKeywords: frozenset = frozenset()) -> Tuple:
+    """
+    Compile (label, keywords) rules into (label, pattern) pairs
+    
+    Each pattern is an alternation of the escaped keywords, so a search
+    matches exactly when any keyword occurs as a substring. Keywords listed
+    in wholeWordKeywords are wrapped in word boundaries instead.
+    
+    @param {Tuple} keywordRules - Ordered (label, keywords) pairs
+    @param {frozenset} wholeWordKeywords - Keywords that only match as whole words
+    @returns {Tuple} Ordered (label, compiled pattern) pairs
+    """
+    return tuple(
+        (label, re.compile('|'.join(
+            rf'\b{re.escape(keyword)}\b' if keyword in wholeWordKeywords else re.escape(keyword)
+            for keyword in keywords
+        )))
+        for label, keywords in keywordRules
+    )
+
+
+JOB_CATEGORY_PATTERNS = _compileKeywordRules(JOB_CATEGORY_KEYWORDS)
+CHANNEL_GROUP_PATTERNS = _compileKeywordRules(CHANNEL_GROUP_KEYWORDS)
+SENIORITY_PATTERNS = _compileKeywordRules(SENIORITY_KEYWORDS, SENIORITY_WHOLE_WORD_KEYWORDS)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _expandLabelCodesKernel(sourceCodes, labelCodes):
+        """
+        Gather the label code of each row's distinct value across threads
+        
+        Negative source codes mark missing values and take the trailing
+        entry of labelCodes, which holds the missing-value label.
+        """
+        missingCode = labelCodes[labelCodes.shape[0] - 1]
+        rowCodes = np.empty(sourceCodes.shape[0], np.int8)
+        for row in prange(sourceCodes.shape[0]):
+            sourceCode = sourceCodes[row]
+            rowCodes[row] = labelCodes[sourceCode] if sourceCode >= 0 else missingCode
+        return rowCodes
+
 
 class DataTransformer:
     """
@@ -24,7 +155,9 @@ class DataTransformer:
         
         @param {pd.DataFrame} dataFrame - Cleaned dataframe to be transformed and enhanced
         """
-        self.dataFrame = dataFrame.copy()
+        # Transformations only add columns, so the input is never mutated and
+        # needs no defensive copy
+        self.dataFrame = dataFrame
         self.transformedData = None
         
         # Configuration constants for transformation operations
@@ -33,6 +166,9 @@ class DataTransformer:
         self.geoColumn = 'Country'
         self.jobColumn = 'Job Title'
         self.targetStatus = 'Registered'
+        
+        # (codes, lowercased distinct values) per column, reset on every run
+        self._factorizedColumns = {}
     
     def transformData(self) -> pd.DataFrame:
         """
@@ -49,7 +185,10 @@ class DataTransformer:
         @returns {pd.DataFrame} Fully transformed dataframe with enhanced features
         """
         print("🔄 Starting comprehensive data transformation process...")
-        dataFrame = self.dataFrame.copy()
+        # Shallow copy: new feature columns go to the copy while the existing
+        # column data is shared (copy-on-write from pandas 3 onwards)
+        dataFrame = self.dataFrame.copy(deep=False)
+        self._factorizedColumns = {}
         
         # 1. Categorize job titles into hierarchical levels
         dataFrame = self._categorizeJobTitles(dataFrame)
@@ -90,56 +229,80 @@ class DataTransformer:
         if self.jobColumn not in dataFrame.columns:
             return dataFrame
         
-        dataFrame['Job Category'] = dataFrame[self.jobColumn].apply(self._categorizeSingleJobTitle)
+        # Keyword matching runs once per distinct title; missing titles are 'Other'
+        codes, titlesLower = self._factorizeLowercase(dataFrame, self.jobColumn)
+        dataFrame['Job Category'] = self._expandUniqueLabels(
+            codes, self._classifyByKeywords(titlesLower, JOB_CATEGORY_PATTERNS, 'Other'), 'Other'
+        )
         
         print("  • Categorized job titles into Executive/Decision Maker/Practitioner hierarchy")
         return dataFrame
     
-    def _categorizeSingleJobTitle(self, jobTitle: str) -> str:
+    def _factorizeLowercase(self, dataFrame: pd.DataFrame, columnName: str) -> Tuple[np.ndarray, pd.Series]:
         """
-        Categorize a single job title using comprehensive keyword matching
+        Factorize a column and lowercase its distinct values
         
-        Uses hierarchical keyword matching to determine job authority level.
-        Prioritizes executive keywords, then decision maker, then practitioner.
+        Real datasets repeat the same titles, channels and countries many times,
+        so string work is done on the distinct values only. The result is reused
+        by every transformation of the same column within one run.
         
-        @param {str} jobTitle - Individual job title to categorize
-        @returns {str} Category classification (Executive/Decision Maker/Practitioner/Other)
+        @param {pd.DataFrame} dataFrame - Dataframe holding the column
+        @param {str} columnName - Column to factorize
+        @returns {Tuple[np.ndarray, pd.Series]} Row codes (-1 for missing) and lowercased distinct values
         """
-        if pd.isna(jobTitle) or jobTitle == 'nan':
-            return 'Other'
+        if columnName not in self._factorizedColumns:
+            codes, uniques = pd.factorize(dataFrame[columnName])
+            self._factorizedColumns[columnName] = (
+                codes, pd.Series(uniques).astype('string').str.lower()
+            )
+        return self._factorizedColumns[columnName]
+    
+    @staticmethod
+    def _classifyByKeywords(loweredValues: pd.Series, patterns: Tuple, default: str) -> np.ndarray:
+        """
+        Assign each value the label of the first keyword pattern it matches
         
-        jobTitleLower = str(jobTitle).lower()
+        Every pattern is scanned over all values by pandas' vectorized string
+        matching and np.select picks the first matching label per value.
         
-        # Executive keywords - highest authority level (C-suite, VP+, Founders)
-        executiveKeywords = [
-            'president', 'ceo', 'cto', 'cmo', 'cfo', 'coo', 'cso', 'cro',
-            'vp', 'vice president', 'chief', 'founder', 'co-founder', 
-            'owner', 'partner', 'board', 'chairman', 'chairwoman'
+        @param {pd.Series} loweredValues - Lowercased values to classify
+        @param {Tuple} patterns - Ordered (label, compiled pattern) pairs
+        @param {str} default - Label for values that match no pattern
+        @returns {np.ndarray} Label for each value
+        """
+        conditions = [
+            loweredValues.str.contains(pattern, na=False).to_numpy(dtype=bool)
+            for _, pattern in patterns
         ]
+        return np.select(conditions, [label for label, _ in patterns], default=default)
+    
+    @staticmethod
+    def _expandUniqueLabels(codes: np.ndarray, uniqueLabels: np.ndarray, missingLabel: str) -> pd.Categorical:
+        """
+        Expand per-distinct-value labels back to every row as a categorical
         
-        # Decision Maker keywords - budget and strategic authority
-        decisionMakerKeywords = [
-            'manager', 'director', 'head', 'lead', 'supervisor',
-            'team lead', 'senior manager', 'general manager', 'regional manager',
-            'product manager', 'project manager', 'program manager'
-        ]
+        Categories are the sorted labels that actually occur, matching what
+        astype('category') produces for the equivalent string column.
         
-        # Practitioner keywords - individual contributors and specialists
-        practitionerKeywords = [
-            'analyst', 'specialist', 'engineer', 'coordinator', 'associate',
-            'junior', 'assistant', 'intern', 'trainee', 'consultant',
-            'developer', 'designer', 'researcher', 'administrator'
-        ]
+        @param {np.ndarray} codes - Row codes from pd.factorize (-1 for missing)
+        @param {np.ndarray} uniqueLabels - Label of each distinct value
+        @param {str} missingLabel - Label for rows with a missing value
+        @returns {pd.Categorical} Label for each row
+        """
+        uniqueLabels = np.asarray(uniqueLabels, dtype=object)
+        if (codes < 0).any():
+            # Code -1 selects the appended trailing label
+            uniqueLabels = np.append(uniqueLabels, missingLabel)
+        
+        categories, labelCodes = np.unique(uniqueLabels.astype(str), return_inverse=True)
+        labelCodes = labelCodes.astype(np.int8)
         
-        # Check categories in hierarchical order of authority
-        if any(keyword in jobTitleLower for keyword in executiveKeywords):
-            return 'Executive'
-        elif any(keyword in jobTitleLower for keyword in decisionMakerKeywords):
-            return 'Decision Maker'
-        elif any(keyword in jobTitleLower for keyword in practitionerKeywords):
-            return 'Practitioner'
+        # Translate the per-row integer codes without touching any strings
+        if NUMBA_AVAILABLE and len(codes) >= LARGE_TABLE_MIN_ROWS and len(labelCodes) > 0:
+            rowCodes = _expandLabelCodesKernel(codes, labelCodes)
         else:
-            return 'Other'
+            rowCodes = labelCodes[codes]
+        return pd.Categorical.from_codes(rowCodes, categories=categories)
     
     def _createFunnelFlags(self, dataFrame: pd.DataFrame) -> pd.DataFrame:
         """
@@ -158,11 +321,15 @@ class DataTransformer:
         if self.statusColumn not in dataFrame.columns:
             return dataFrame
         
-        # Create binary flags for each prospect status
-        dataFrame['isRegistered'] = (dataFrame[self.statusColumn] == 'Registered').astype(int)
-        dataFrame['isAttended'] = (dataFrame[self.statusColumn] == 'Attended').astype(int)
-        dataFrame['isResponded'] = (dataFrame[self.statusColumn] == 'Responded').astype(int)
-        dataFrame['isNoShow'] = (dataFrame[self.statusColumn] == 'No Show').astype(int)
+        # Encode the status column once; statuses without a flag get code -1
+        statusCodes = pd.Categorical(
+            dataFrame[self.statusColumn],
+            categories=[status for _, status in FUNNEL_FLAG_STATUSES]
+        ).codes
+        
+        # Create int8 binary flags for each prospect status from the shared codes
+        for statusCode, (flagColumn, _) in enumerate(FUNNEL_FLAG_STATUSES):
+            dataFrame[flagColumn] = (statusCodes == statusCode).view(np.int8)
         
         # Create primary conversion flag for analysis
         dataFrame['isConverted'] = dataFrame['isRegistered']
@@ -189,40 +356,10 @@ class DataTransformer:
         if self.channelColumn not in dataFrame.columns:
             return dataFrame
         
-        def groupChannel(channel):
-            if pd.isna(channel):
-                return 'Unknown'
-            
-            channelLower = str(channel).lower()
-            
-            # Paid media channels - advertising and paid promotion
-            if any(word in channelLower for word in ['advertisement', 'ad', 'paid', 'ppc', 'adwords']):
-                return 'Paid Media'
-            
-            # Social media channels - social platforms and networks
-            elif any(word in channelLower for word in ['social', 'facebook', 'linkedin', 'twitter']):
-                return 'Social Media'
-            
-            # Referral channels - word-of-mouth and recommendations
-            elif any(word in channelLower for word in ['referral', 'word of mouth', 'recommendation']):
-                return 'Referral'
-            
-            # Event channels - conferences, trade shows, webinars
-            elif any(word in channelLower for word in ['trade show', 'event', 'conference', 'webinar']):
-                return 'Events'
-            
-            # Content marketing channels - SEO, blogs, organic content
-            elif any(word in channelLower for word in ['content', 'blog', 'seo', 'organic']):
-                return 'Content Marketing'
-            
-            # Email marketing channels - campaigns and newsletters
-            elif any(word in channelLower for word in ['email', 'newsletter', 'campaign']):
-                return 'Email Marketing'
-            
-            else:
-                return 'Other'
-        
-        dataFrame['Channel Group'] = dataFrame[self.channelColumn].apply(groupChannel)
+        codes, channelsLower = self._factorizeLowercase(dataFrame, self.channelColumn)
+        dataFrame['Channel Group'] = self._expandUniqueLabels(
+            codes, self._classifyByKeywords(channelsLower, CHANNEL_GROUP_PATTERNS, 'Other'), 'Unknown'
+        )
         
         print("  • Created strategic channel groupings for marketing analysis")
         return dataFrame
@@ -244,32 +381,15 @@ class DataTransformer:
         if self.geoColumn not in dataFrame.columns:
             return dataFrame
         
-        def getRegion(country):
-            if pd.isna(country):
-                return 'Unknown'
-            
-            countryLower = str(country).lower()
-            
-            # North America region - major North American markets
-            if countryLower in ['united states', 'canada', 'mexico']:
-                return 'North America'
-            
-            # Europe region - major European markets
-            elif countryLower in ['united kingdom', 'germany', 'france', 'italy', 'spain', 'netherlands']:
-                return 'Europe'
-            
-            # Asia Pacific region - major APAC markets
-            elif countryLower in ['china', 'japan', 'india', 'australia', 'singapore']:
-                return 'Asia Pacific'
-            
-            # Latin America region - major LATAM markets
-            elif countryLower in ['brazil', 'argentina', 'chile', 'colombia']:
-                return 'Latin America'
-            
-            else:
-                return 'Other Regions'
+        codes, countriesLower = self._factorizeLowercase(dataFrame, self.geoColumn)
         
-        dataFrame['Geographic Region'] = dataFrame[self.geoColumn].apply(getRegion)
+        # Exact membership per region; missing countries are labelled 'Unknown'
+        regionLabels = np.select(
+            [countriesLower.isin(countries).to_numpy(dtype=bool) for _, countries in GEOGRAPHIC_REGION_COUNTRIES],
+            [region for region, _ in GEOGRAPHIC_REGION_COUNTRIES],
+            default='Other Regions'
+        )
+        dataFrame['Geographic Region'] = self._expandUniqueLabels(codes, regionLabels, 'Unknown')
         
         print("  • Created strategic geographic regions for market analysis")
         return dataFrame
@@ -289,25 +409,11 @@ class DataTransformer:
         if self.jobColumn not in dataFrame.columns:
             return dataFrame
         
-        def getSeniority(jobTitle):
-            if pd.isna(jobTitle):
-                return 'Unknown'
-            
-            jobTitleLower = str(jobTitle).lower()
-            
-            # Senior level positions - experienced professionals
-            if any(word in jobTitleLower for word in ['senior', 'sr', 'lead', 'principal', 'chief']):
-                return 'Senior'
-            
-            # Junior level positions - entry-level professionals
-            elif any(word in jobTitleLower for word in ['junior', 'jr', 'associate', 'intern', 'trainee']):
-                return 'Junior'
-            
-            # Mid-level positions - standard professional level
-            else:
-                return 'Mid-Level'
-        
-        dataFrame['Seniority Level'] = dataFrame[self.jobColumn].apply(getSeniority)
+        # Reuses the distinct titles factorized for the job categories
+        codes, titlesLower = self._factorizeLowercase(dataFrame, self.jobColumn)
+        dataFrame['Seniority Level'] = self._expandUniqueLabels(
+            codes, self._classifyByKeywords(titlesLower, SENIORITY_PATTERNS, 'Mid-Level'), 'Unknown'
+        )
         
         print("  • Created seniority level classifications for targeting analysis")
         return dataFrame
@@ -325,31 +431,58 @@ class DataTransformer:
         @returns {pd.DataFrame} DataFrame with advanced conversion metrics
         """
         # Calculate engagement score based on funnel progression
-        engagementScore = (
-            dataFrame.get('isRegistered', 0) * 4 +
-            dataFrame.get('isAttended', 0) * 3 +
-            dataFrame.get('isResponded', 0) * 2 +
-            (1 - dataFrame.get('isNoShow', 0)) * 1
-        )
-        dataFrame['Engagement Score'] = engagementScore
-        
-        # Create value potential mapping based on job authority
-        valueMapping = {
-            'Executive': 5,      # Highest value - decision makers
-            'Decision Maker': 4, # High value - budget authority
-            'Practitioner': 3,   # Medium value - end users
-            'Other': 2          # Lower value - unclear authority
-        }
+        flagColumns = [flagColumn for flagColumn, _ in FUNNEL_FLAG_STATUSES]
+        if all(flagColumn in dataFrame.columns for flagColumn in flagColumns):
+            dataFrame['Engagement Score'] = self._computeEngagementScore(
+                {flagColumn: dataFrame[flagColumn].to_numpy() for flagColumn in flagColumns}
+            )
+        else:
+            engagementScore = (
+                dataFrame.get('isRegistered', 0) * 4 +
+                dataFrame.get('isAttended', 0) * 3 +
+                dataFrame.get('isResponded', 0) * 2 +
+                (1 - dataFrame.get('isNoShow', 0)) * 1
+            )
+            dataFrame['Engagement Score'] = engagementScore
         
         # Apply value potential scoring
         if 'Job Category' in dataFrame.columns:
-            dataFrame['Value Potential'] = dataFrame['Job Category'].map(valueMapping).fillna(2)
+            jobCategories = dataFrame['Job Category'].astype('category')
+            
+            # One score per category plus a trailing default that code -1 (missing) selects
+            valueLookup = np.array(
+                [VALUE_POTENTIAL_SCORES.get(category, DEFAULT_VALUE_POTENTIAL)
+                 for category in jobCategories.cat.categories] + [DEFAULT_VALUE_POTENTIAL],
+                dtype=np.int8
+            )
+            dataFrame['Value Potential'] = valueLookup[jobCategories.cat.codes.to_numpy()]
         else:
-            dataFrame['Value Potential'] = 2
+            dataFrame['Value Potential'] = DEFAULT_VALUE_POTENTIAL
         
         print("  • Created advanced conversion metrics for lead scoring and analysis")
         return dataFrame
     
+    @staticmethod
+    def _computeEngagementScore(funnelFlags: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Evaluate the weighted engagement score over the int8 funnel flag arrays
+        
+        Large tables are evaluated by numexpr in one fused, multi-threaded pass;
+        smaller ones use plain NumPy arithmetic, which stays in int8.
+        
+        @param {Dict[str, np.ndarray]} funnelFlags - Flag arrays keyed by flag column name
+        @returns {np.ndarray} Engagement score (1-10) for each row as int8
+        """
+        if NUMEXPR_AVAILABLE and len(funnelFlags['isRegistered']) >= LARGE_TABLE_MIN_ROWS:
+            return numexpr.evaluate(ENGAGEMENT_SCORE_EXPRESSION, local_dict=funnelFlags).astype(np.int8)
+        
+        return (
+            funnelFlags['isRegistered'] * 4 +
+            funnelFlags['isAttended'] * 3 +
+            funnelFlags['isResponded'] * 2 +
+            (1 - funnelFlags['isNoShow'])
+        )
+    
     def getFeatureSummary(self) -> Dict[str, Any]:
         """
         Generate comprehensive summary of created features and transformations
@@ -379,11 +512,13 @@ class DataTransformer:
         for column in newColumns:
             if column in self.transformedData.columns:
                 dataType = str(self.transformedData[column].dtype)
-                uniqueValues = self.transformedData[column].nunique()
+                
+                # One hash pass yields the distinct non-null values in order of appearance
+                _, uniqueValues = pd.factorize(self.transformedData[column])
                 summaryData['featureTypes'][column] = {
                     'type': dataType,
-                    'uniqueValues': uniqueValues,
-                    'sampleValues': self.transformedData[column].dropna().unique()[:5].tolist()
+                    'uniqueValues': len(uniqueValues),
+                    'sampleValues': uniqueValues[:5].tolist()
                 }
         
         return summaryData